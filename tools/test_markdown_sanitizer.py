@@ -5,8 +5,12 @@ from markdown import Markdown
 
 
 class TestBasicTextExtension(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.md = Markdown(extensions=[BasicFormattingEnforcingExtension()])
+
     def setUp(self):
-        self.md = Markdown(extensions=[BasicFormattingEnforcingExtension()])
+        self.md.reset()
 
     def test_backtick_not_allowed(self):
         with self.assertRaises(Exception):